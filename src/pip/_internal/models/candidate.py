@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 
 from pip._vendor.packaging.version import Version
-from pip._vendor.packaging.version import parse as parse_version
 
 from pip._internal.models.link import Link
+from pip._internal.utils.packaging import parse_version
 
 
 @dataclass(frozen=True)
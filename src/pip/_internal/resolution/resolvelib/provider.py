@@ -1,13 +1,13 @@
-import collections
 import math
-from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     Mapping,
     Sequence,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -51,9 +51,27 @@ D = TypeVar("D")
 V = TypeVar("V")
 
 
+def _strip_extras(identifier: str) -> str:
+    """Get the package name part of a resolver identifier.
+
+    Identifiers with requested extras are in the "NAME[EXTRAS]" format; other
+    identifiers are returned unchanged.
+    """
+    # HACK: Theoretically we should check whether this identifier is a valid
+    # "NAME[EXTRAS]" format, and parse out the name part with packaging or
+    # some regular expression. But since pip's resolver only spits out three
+    # kinds of identifiers: normalized PEP 503 names, normalized names plus
+    # extras, and Requires-Python, we can cheat a bit here.
+    open_bracket = identifier.find("[")
+    if open_bracket == -1:
+        return identifier
+    return identifier[:open_bracket]
+
+
 def _get_with_identifier(
     mapping: Mapping[str, V],
     identifier: str,
+    name: str,
     default: D,
 ) -> Union[D, V]:
     """Get item from a package name lookup mapping with a resolver identifier.
@@ -61,17 +79,13 @@ def _get_with_identifier(
     This extra logic is needed when the target mapping is keyed by package
     name, which cannot be directly looked up with an identifier (which may
     contain requested extras). Additional logic is added to also look up a value
-    by "cleaning up" the extras from the identifier.
+    by "cleaning up" the extras from the identifier, where ``name`` is the
+    identifier as returned by ``_strip_extras()``. It is passed in, so it can
+    be computed once for several lookups of the same identifier.
     """
     if identifier in mapping:
         return mapping[identifier]
-    # HACK: Theoretically we should check whether this identifier is a valid
-    # "NAME[EXTRAS]" format, and parse out the name part with packaging or
-    # some regular expression. But since pip's resolver only spits out three
-    # kinds of identifiers: normalized PEP 503 names, normalized names plus
-    # extras, and Requires-Python, we can cheat a bit here.
-    name, open_bracket, _ = identifier.partition("[")
-    if open_bracket and name in mapping:
+    if name != identifier and name in mapping:
         return mapping[name]
     return default
 
@@ -87,6 +101,18 @@ class PipProvider(_ProviderBase):
         supplied for pip to install/upgrade.
     """
 
+    __slots__ = [
+        "_factory",
+        "_constraints",
+        "_ignore_dependencies",
+        "_upgrade_strategy",
+        "_user_requested",
+        "_known_depths",
+        "_backtrack_causes",
+        "_backtrack_cause_names",
+        "_satisfied_by_cache",
+    ]
+
     def __init__(
         self,
         factory: Factory,
@@ -100,7 +126,10 @@ class PipProvider(_ProviderBase):
         self._ignore_dependencies = ignore_dependencies
         self._upgrade_strategy = upgrade_strategy
         self._user_requested = user_requested
-        self._known_depths: Dict[str, float] = collections.defaultdict(lambda: math.inf)
+        self._known_depths: Dict[str, float] = {}
+        self._backtrack_causes: Tuple["PreferenceInformation", ...] = ()
+        self._backtrack_cause_names: FrozenSet[str] = frozenset()
+        self._satisfied_by_cache: Dict[Tuple[Requirement, Candidate], bool] = {}
 
     def identify(self, requirement_or_candidate: Union[Requirement, Candidate]) -> str:
         return requirement_or_candidate.name
@@ -133,60 +162,56 @@ class PipProvider(_ProviderBase):
           operator, such as ``>=`` or ``<``.
         * If equal, order alphabetically for consistency (helps debuggability).
         """
-        try:
-            next(iter(information[identifier]))
-        except StopIteration:
-            # There is no information for this identifier, so there's no known
-            # candidates.
-            has_information = False
-        else:
-            has_information = True
-
-        if has_information:
-            lookups = (r.get_candidate_lookup() for r, _ in information[identifier])
-            candidate, ireqs = zip(*lookups)
-        else:
-            candidate, ireqs = None, ()
-
-        operators = [
-            specifier.operator
-            for specifier_set in (ireq.specifier for ireq in ireqs if ireq)
-            for specifier in specifier_set
-        ]
-
-        direct = candidate is not None
-        pinned = any(op[:2] == "==" for op in operators)
-        unfree = bool(operators)
+        # Requires-Python has only one candidate and the check is basically
+        # free, so we always do it first to avoid needless work if it fails.
+        # Since this alone puts it before everything else, the rest of the key
+        # is not computed.
+        if identifier == REQUIRES_PYTHON_IDENTIFIER:
+            return (False, True, True, True, math.inf, math.inf, True, identifier)
 
         try:
             requested_order: Union[int, float] = self._user_requested[identifier]
         except KeyError:
             requested_order = math.inf
-            if has_information:
-                parent_depths = (
-                    self._known_depths[parent.name] if parent is not None else 0.0
-                    for _, parent in information[identifier]
-                )
-                inferred_depth = min(d for d in parent_depths) + 1.0
-            else:
-                inferred_depth = math.inf
+            # Inferred from the parents below. If there is no information for
+            # this identifier, there are no known parents and it stays infinite.
+            infer_depth = True
+            inferred_depth = math.inf
         else:
+            infer_depth = False
             inferred_depth = 1.0
-        self._known_depths[identifier] = inferred_depth
-
-        requested_order = self._user_requested.get(identifier, math.inf)
 
-        # Requires-Python has only one candidate and the check is basically
-        # free, so we always do it first to avoid needless work if it fails.
-        requires_python = identifier == REQUIRES_PYTHON_IDENTIFIER
+        # Everything needed from the information is collected in a single pass.
+        direct = False
+        pinned = False
+        unfree = False
+        for requirement, parent in information[identifier]:
+            candidate, ireq = requirement.get_candidate_lookup()
+            if candidate is not None:
+                direct = True
+            if ireq is not None:
+                for specifier in ireq.specifier:
+                    unfree = True
+                    if specifier.operator in ("==", "==="):
+                        pinned = True
+            if infer_depth:
+                parent_depth = (
+                    self._known_depths.get(parent.name, math.inf)
+                    if parent is not None
+                    else 0.0
+                )
+                inferred_depth = min(inferred_depth, parent_depth + 1.0)
+        self._known_depths[identifier] = inferred_depth
 
         # Prefer the causes of backtracking on the assumption that the problem
         # resolving the dependency tree is related to the failures that caused
         # the backtracking
-        backtrack_cause = self.is_backtrack_cause(identifier, backtrack_causes)
+        backtrack_cause = identifier in self._get_backtrack_cause_names(
+            backtrack_causes
+        )
 
         return (
-            not requires_python,
+            True,  # Not Requires-Python.
             not direct,
             not pinned,
             not backtrack_cause,
@@ -202,7 +227,9 @@ class PipProvider(_ProviderBase):
         requirements: Mapping[str, Iterator[Requirement]],
         incompatibilities: Mapping[str, Iterator[Candidate]],
     ) -> Iterable[Candidate]:
-        def _eligible_for_upgrade(identifier: str) -> bool:
+        name = _strip_extras(identifier)
+
+        def _eligible_for_upgrade() -> bool:
             """Are upgrades allowed for this project?
 
             This checks the upgrade strategy, and whether the project was one
@@ -219,6 +246,7 @@ class PipProvider(_ProviderBase):
                 user_order = _get_with_identifier(
                     self._user_requested,
                     identifier,
+                    name,
                     default=None,
                 )
                 return user_order is not None
@@ -227,25 +255,56 @@ class PipProvider(_ProviderBase):
         constraint = _get_with_identifier(
             self._constraints,
             identifier,
+            name,
             default=Constraint.empty(),
         )
         return self._factory.find_candidates(
             identifier=identifier,
             requirements=requirements,
             constraint=constraint,
-            prefers_installed=(not _eligible_for_upgrade(identifier)),
+            prefers_installed=(not _eligible_for_upgrade()),
             incompatibilities=incompatibilities,
             is_satisfied_by=self.is_satisfied_by,
         )
 
-    @lru_cache(maxsize=None)
     def is_satisfied_by(self, requirement: Requirement, candidate: Candidate) -> bool:
-        return requirement.is_satisfied_by(candidate)
+        # The same pairs are checked over and over again during resolution. The
+        # cache lives on the provider, so it is freed along with it instead of
+        # keeping every requirement and candidate alive for the whole process.
+        key = (requirement, candidate)
+        try:
+            return self._satisfied_by_cache[key]
+        except KeyError:
+            satisfied = requirement.is_satisfied_by(candidate)
+            self._satisfied_by_cache[key] = satisfied
+            return satisfied
 
     def get_dependencies(self, candidate: Candidate) -> Sequence[Requirement]:
         with_requires = not self._ignore_dependencies
         return [r for r in candidate.iter_dependencies(with_requires) if r is not None]
 
+    def _get_backtrack_cause_names(
+        self, backtrack_causes: Sequence["PreferenceInformation"]
+    ) -> FrozenSet[str]:
+        """Get the names of the requirements (and their parents) that caused
+        the resolver to backtrack.
+
+        resolvelib passes the same causes for every identifier in a round, so
+        the names are only collected again when the causes change. The causes
+        sequence is updated in place by resolvelib, so a snapshot of it is
+        compared instead of its identity.
+        """
+        causes = tuple(backtrack_causes)
+        if causes != self._backtrack_causes:
+            self._backtrack_causes = causes
+            names = set()
+            for cause in causes:
+                names.add(cause.requirement.name)
+                if cause.parent:
+                    names.add(cause.parent.name)
+            self._backtrack_cause_names = frozenset(names)
+        return self._backtrack_cause_names
+
     @staticmethod
     def is_backtrack_cause(
         identifier: str, backtrack_causes: Sequence["PreferenceInformation"]
@@ -161,6 +161,7 @@ class RequiresPythonRequirement(Requirement):
         self._specifier_string = str(specifier)  # for faster __eq__
         self._hash: Optional[int] = None
         self._candidate = match
+        self._candidate_lookup: Optional[CandidateLookup] = None
 
     def __str__(self) -> str:
         return f"Python {self.specifier}"
@@ -195,9 +196,16 @@ class RequiresPythonRequirement(Requirement):
         return str(self)
 
     def get_candidate_lookup(self) -> CandidateLookup:
+        # The lookup is requested on every resolution round, but the outcome
+        # of the specifier check never changes, so only do it once.
+        if self._candidate_lookup is not None:
+            return self._candidate_lookup
+
         if self.specifier.contains(self._candidate.version, prereleases=True):
-            return self._candidate, None
-        return None, None
+            self._candidate_lookup = self._candidate, None
+        else:
+            self._candidate_lookup = None, None
+        return self._candidate_lookup
 
     def is_satisfied_by(self, candidate: Candidate) -> bool:
         assert candidate.name == self._candidate.name, "Not Python candidate"
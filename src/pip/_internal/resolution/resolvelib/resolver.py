@@ -4,7 +4,6 @@ import logging
 import os
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, cast
 
-from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.resolvelib import BaseReporter, ResolutionImpossible
 from pip._vendor.resolvelib import Resolver as RLResolver
 from pip._vendor.resolvelib.structs import DirectedGraph
@@ -245,51 +244,59 @@ def get_topological_weights(
     path: Set[Optional[str]] = set()
     weights: Dict[Optional[str], int] = {}
 
-    def visit(node: Optional[str]) -> None:
-        if node in path:
-            # We hit a cycle, so we'll break it here.
-            return
-
-        # Time to visit the children!
-        path.add(node)
-        for child in graph.iter_children(node):
-            visit(child)
-        path.remove(node)
+    def visit(root: Optional[str]) -> None:
+        # The traversal keeps an explicit stack of (node, children iterator)
+        # pairs rather than recursing, so deep dependency chains cannot hit
+        # Python's recursion limit.
+        path.add(root)
+        stack = [(root, graph.iter_children(root))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child in path:
+                    # We hit a cycle, so we'll break it here.
+                    continue
+                # Time to visit the child's children!
+                path.add(child)
+                stack.append((child, graph.iter_children(child)))
+                break
+            else:
+                # All children are visited, leave this node.
+                stack.pop()
+                path.remove(node)
 
-        if node not in requirement_keys:
-            return
+                if node not in requirement_keys:
+                    continue
 
-        last_known_parent_count = weights.get(node, 0)
-        weights[node] = max(last_known_parent_count, len(path))
+                last_known_parent_count = weights.get(node, 0)
+                weights[node] = max(last_known_parent_count, len(path))
 
     # Simplify the graph, pruning leaves that have no dependencies.
     # This is needed for large graphs (say over 200 packages) because the
     # `visit` function is exponentially slower then, taking minutes.
     # See https://github.com/pypa/pip/issues/10557
-    # We will loop until we explicitly break the loop.
-    while True:
-        leaves = set()
-        for key in graph:
-            if key is None:
-                continue
-            for _child in graph.iter_children(key):
-                # This means we have at least one child
-                break
-            else:
-                # No child.
-                leaves.add(key)
-        if not leaves:
-            # We are done simplifying.
-            break
+    # The number of remaining children is tracked for each node, so new leaves
+    # are found by walking up from the pruned ones, instead of rescanning the
+    # whole graph on each pass.
+    child_counts = {key: sum(1 for _ in graph.iter_children(key)) for key in graph}
+    leaves = {
+        key for key, count in child_counts.items() if key is not None and not count
+    }
+    while leaves:
         # Calculate the weight for the leaves.
         weight = len(graph) - 1
+        new_leaves = set()
         for leaf in leaves:
-            if leaf not in requirement_keys:
-                continue
-            weights[leaf] = weight
+            if leaf in requirement_keys:
+                weights[leaf] = weight
+            for parent in graph.iter_parents(leaf):
+                child_counts[parent] -= 1
+                if parent is not None and not child_counts[parent]:
+                    new_leaves.add(parent)
         # Remove the leaves from the graph, making it simpler.
         for leaf in leaves:
             graph.remove(leaf)
+        leaves = new_leaves
 
     # Visit the remaining graph.
     # `None` is guaranteed to be the root node by resolvelib.
@@ -312,6 +319,9 @@ def _req_set_item_sorter(
     Based on the "weight" mapping calculated in ``get_installation_order()``.
     The canonical package name is returned as the second member as a tie-
     breaker to ensure the result is predictable, which is useful in tests.
+
+    Keys of ``RequirementSet.requirements`` are already canonicalized, so they
+    are used to look up the weight directly.
     """
-    name = canonicalize_name(item[0])
+    name = item[0]
     return weights[name], name
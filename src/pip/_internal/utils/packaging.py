@@ -11,6 +11,7 @@ NormalizedExtra = NewType("NormalizedExtra", str)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
 def check_requires_python(
     requires_python: Optional[str], version_info: Tuple[int, ...]
 ) -> bool:
@@ -25,6 +26,9 @@ def check_requires_python(
 
     :raises InvalidSpecifier: If `requires_python` has an invalid format.
     """
+    # This is called for every link found on an index, with only a handful of
+    # distinct Requires-Python strings among them. Caching on the string avoids
+    # parsing the same specifier (and the Python version) over and over again.
     if requires_python is None:
         # The package provides no information
         return True
@@ -45,6 +49,15 @@ def get_requirement(req_string: str) -> Requirement:
     return Requirement(req_string)
 
 
+@functools.lru_cache(maxsize=2048)
+def parse_version(version_string: str) -> version.Version:
+    """Construct a packaging.Version object with caching"""
+    # Version strings repeat a lot, e.g. every file of a release on an index
+    # carries the same one. Since Version objects are immutable, the parsed
+    # result can be shared between all of them instead of parsed again.
+    return version.parse(version_string)
+
+
 def safe_extra(extra: str) -> NormalizedExtra:
     """Convert an arbitrary string to a standard 'extra' name
 
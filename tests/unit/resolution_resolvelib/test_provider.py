@@ -1,21 +1,33 @@
-from typing import TYPE_CHECKING, List, Optional
+import math
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import pytest
 from pip._vendor.resolvelib.resolvers import RequirementInformation
 
 from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.link import Link
 from pip._internal.req.constructors import install_req_from_req_string
-from pip._internal.resolution.resolvelib.factory import Factory
-from pip._internal.resolution.resolvelib.provider import PipProvider
-from pip._internal.resolution.resolvelib.requirements import SpecifierRequirement
+from pip._internal.resolution.resolvelib.candidates import REQUIRES_PYTHON_IDENTIFIER
+from pip._internal.resolution.resolvelib.provider import (
+    PipProvider,
+    _get_with_identifier,
+    _strip_extras,
+)
+from pip._internal.resolution.resolvelib.requirements import (
+    ExplicitRequirement,
+    SpecifierRequirement,
+)
 
 if TYPE_CHECKING:
+    from pip._vendor.resolvelib.providers import Preference
+
+    from pip._internal.resolution.resolvelib.factory import Factory
     from pip._internal.resolution.resolvelib.provider import PreferenceInformation
 
 
-def build_requirement_information(
-    name: str, parent: Optional[InstallationCandidate]
-) -> List["PreferenceInformation"]:
+def build_req_info(
+    name: str, parent: Optional[InstallationCandidate] = None
+) -> "PreferenceInformation":
     install_requirement = install_req_from_req_string(name)
     # RequirementInformation is typed as a tuple, but it is a namedtupled.
     # https://github.com/sarugaku/resolvelib/blob/7bc025aa2a4e979597c438ad7b17d2e8a08a364e/src/resolvelib/resolvers.pyi#L20-L22
@@ -23,10 +35,201 @@ def build_requirement_information(
         requirement=SpecifierRequirement(install_requirement),  # type: ignore[call-arg]
         parent=parent,
     )
-    return [requirement_information]
+    return requirement_information
+
+
+@pytest.mark.parametrize(
+    "identifier, expected",
+    [
+        ("my-package", 1),
+        ("my-package[extra]", 1),
+        ("my-package[extra-one,extra-two]", 1),
+        ("other-package", None),
+        ("other-package[extra]", None),
+        (REQUIRES_PYTHON_IDENTIFIER, None),
+    ],
+)
+def test_get_with_identifier(identifier: str, expected: Optional[int]) -> None:
+    mapping = {"my-package": 1}
+    name = _strip_extras(identifier)
+    assert _get_with_identifier(mapping, identifier, name, default=None) == expected
+
+
+class _RequiresPythonStub:
+    """Stand-in for the Requires-Python requirement.
+
+    get_preference() ranks Requires-Python by its identifier alone, so there
+    is no need to build a full install requirement for it.
+    """
+
+    name = REQUIRES_PYTHON_IDENTIFIER
+    project_name = REQUIRES_PYTHON_IDENTIFIER
+
+
+_REQUIRES_PYTHON_REQ: "PreferenceInformation" = RequirementInformation(
+    requirement=_RequiresPythonStub(),  # type: ignore[call-arg]
+    parent=None,
+)
+
+
+class _DirectCandidateStub:
+    """Stand-in for the candidate of an explicit (URL) requirement.
+
+    get_preference() only checks whether a requirement looks up a candidate,
+    so there is no need to build and prepare a real one from a link.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.project_name = name
+
+
+def _info(name: str, spec: str = "") -> Dict[str, Tuple["PreferenceInformation", ...]]:
+    if spec.startswith("@"):
+        requirement = ExplicitRequirement(
+            _DirectCandidateStub(name)  # type: ignore[arg-type]
+        )
+        info: "PreferenceInformation" = RequirementInformation(
+            requirement=requirement,  # type: ignore[call-arg]
+            parent=None,
+        )
+        return {name: (info,)}
+    return {name: (build_req_info(f"{name}{spec}"),)}
+
+
+@pytest.fixture
+def information(
+    request: pytest.FixtureRequest,
+) -> Dict[str, Tuple["PreferenceInformation", ...]]:
+    name, spec = request.param
+    if name == REQUIRES_PYTHON_IDENTIFIER:
+        return {name: (_REQUIRES_PYTHON_REQ,)}
+    return _info(name, spec)
+
+
+@pytest.fixture
+def backtrack_causes(
+    request: pytest.FixtureRequest,
+    information: Dict[str, Tuple["PreferenceInformation", ...]],
+) -> List["PreferenceInformation"]:
+    # The causes are taken from the information, so they share its objects.
+    return [cause for name in request.param for cause in information[name]]
+
+
+# The information and backtrack causes are built by the fixtures above, so
+# only the rows selected to run pay for constructing their requirements.
+@pytest.mark.parametrize(
+    "identifier, information, backtrack_causes, expected",
+    [
+        (
+            REQUIRES_PYTHON_IDENTIFIER,
+            (REQUIRES_PYTHON_IDENTIFIER, ""),
+            (),
+            (
+                False,
+                True,
+                True,
+                True,
+                math.inf,
+                math.inf,
+                True,
+                REQUIRES_PYTHON_IDENTIFIER,
+            ),
+        ),
+        (
+            "direct-package",
+            ("direct-package", "@ https://example.com/direct_package-1.0.tar.gz"),
+            (),
+            (True, False, True, True, 1.0, math.inf, True, "direct-package"),
+        ),
+        (
+            "pinned-package",
+            ("pinned-package", "==1.0"),
+            (),
+            (True, True, False, True, 1.0, math.inf, False, "pinned-package"),
+        ),
+        (
+            "not-pinned-package",
+            ("not-pinned-package", "!=1.0"),
+            (),
+            (True, True, True, True, 1.0, math.inf, False, "not-pinned-package"),
+        ),
+        (
+            "backtrack-package",
+            ("backtrack-package", ""),
+            ("backtrack-package",),
+            (True, True, True, False, 1.0, math.inf, True, "backtrack-package"),
+        ),
+        (
+            "unfree-package",
+            ("unfree-package", ">=1.0"),
+            (),
+            (True, True, True, True, 1.0, math.inf, False, "unfree-package"),
+        ),
+        (
+            "free-package",
+            ("free-package", ""),
+            (),
+            (True, True, True, True, 1.0, math.inf, True, "free-package"),
+        ),
+    ],
+    indirect=["information", "backtrack_causes"],
+    ids=[
+        "requires-python",
+        "direct",
+        "pinned",
+        "not-pinned",
+        "backtrack",
+        "unfree",
+        "free",
+    ],
+)
+def test_get_preference(
+    identifier: str,
+    information: Dict[str, Iterable["PreferenceInformation"]],
+    backtrack_causes: Sequence["PreferenceInformation"],
+    expected: "Preference",
+    provider: PipProvider,
+) -> None:
+    preference = provider.get_preference(
+        identifier=identifier,
+        resolutions={},
+        candidates={},
+        information=information,
+        backtrack_causes=backtrack_causes,
+    )
+
+    assert preference == expected
+
+
+def test_get_preference_backtrack_causes_updated_in_place(
+    provider: PipProvider,
+) -> None:
+    information = {"my-package": [build_req_info("my-package")]}
+    backtrack_causes: List["PreferenceInformation"] = []
 
+    def get_preference() -> "Preference":
+        return provider.get_preference(
+            identifier="my-package",
+            resolutions={},
+            candidates={},
+            information=information,
+            backtrack_causes=backtrack_causes,
+        )
 
-def test_provider_known_depths(factory: Factory) -> None:
+    not_cause = (True, True, True, True, 1.0, math.inf, True, "my-package")
+    cause = (True, True, True, False, 1.0, math.inf, True, "my-package")
+    assert get_preference() == not_cause
+
+    # resolvelib replaces the causes in place between rounds.
+    backtrack_causes[:] = [build_req_info("my-package")]
+    assert get_preference() == cause
+
+    backtrack_causes[:] = [build_req_info("other-package")]
+    assert get_preference() == not_cause
+
+
+def test_provider_known_depths(factory: "Factory") -> None:
     # Root requirement is specified by the user
     # therefore has an inferred depth of 1
     root_requirement_name = "my-package"
@@ -38,9 +241,9 @@ def test_provider_known_depths(factory: Factory) -> None:
         user_requested={root_requirement_name: 0},
     )
 
-    root_requirement_information = build_requirement_information(
-        name=root_requirement_name, parent=None
-    )
+    root_requirement_information = [
+        build_req_info(name=root_requirement_name, parent=None)
+    ]
     provider.get_preference(
         identifier=root_requirement_name,
         resolutions={},
@@ -59,9 +262,9 @@ def test_provider_known_depths(factory: Factory) -> None:
     )
     transitive_requirement_name = "my-transitive-package"
 
-    transitive_package_information = build_requirement_information(
-        name=transitive_requirement_name, parent=root_package_candidate
-    )
+    transitive_package_information = [
+        build_req_info(name=transitive_requirement_name, parent=root_package_candidate)
+    ]
     provider.get_preference(
         identifier=transitive_requirement_name,
         resolutions={},
@@ -76,3 +279,23 @@ def test_provider_known_depths(factory: Factory) -> None:
         transitive_requirement_name: 2.0,
         root_requirement_name: 1.0,
     }
+
+
+def test_provider_known_depths_unknown_parent(provider: PipProvider) -> None:
+    # The depth of a parent that was never ranked is unknown, so the depth of
+    # its dependency cannot be inferred either.
+    parent_candidate = InstallationCandidate(
+        "unknown-package",
+        "1.0",
+        Link("https://unknown-package.com"),
+    )
+    provider.get_preference(
+        identifier="my-package",
+        resolutions={},
+        candidates={},
+        information={
+            "my-package": [build_req_info("my-package", parent=parent_candidate)]
+        },
+        backtrack_causes=[],
+    )
+    assert provider._known_depths == {"my-package": math.inf}
@@ -297,3 +297,17 @@ def test_new_resolver_topological_weights(
 
     weights = get_topological_weights(graph, requirement_keys)
     assert weights == expected_weights
+
+
+def test_new_resolver_topological_weights_deep_cycle() -> None:
+    # A chain much longer than the recursion limit, closed into a cycle so
+    # leaf pruning cannot simplify it away.
+    depth = 5000
+    names = [f"pkg-{i}" for i in range(depth)]
+    edges: List[Tuple[Optional[str], Optional[str]]] = [(None, names[0])]
+    edges.extend(zip(names, names[1:]))
+    edges.append((names[-1], names[0]))
+    graph = _make_graph(edges)
+
+    weights = get_topological_weights(graph, set(names))
+    assert weights == {name: i + 1 for i, name in enumerate(names)}
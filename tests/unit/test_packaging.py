@@ -3,8 +3,13 @@ from typing import Optional, Tuple
 import pytest
 from pip._vendor.packaging import specifiers
 from pip._vendor.packaging.requirements import Requirement
+from pip._vendor.packaging.version import InvalidVersion, Version
 
-from pip._internal.utils.packaging import check_requires_python, get_requirement
+from pip._internal.utils.packaging import (
+    check_requires_python,
+    get_requirement,
+    parse_version,
+)
 
 
 @pytest.mark.parametrize(
@@ -42,3 +47,15 @@ def test_get_or_create_caching() -> None:
         assert getattr(from_helper, iattr) == getattr(freshly_made, iattr)
     assert get_requirement(teststr) is not Requirement(teststr)
     assert get_requirement(teststr) is get_requirement(teststr)
+
+
+def test_parse_version_caching() -> None:
+    """test caching of parse_version"""
+    teststr = "1.10.post1"
+    assert parse_version(teststr) == Version(teststr)
+    assert parse_version(teststr) is parse_version(teststr)
+
+
+def test_parse_version__invalid() -> None:
+    with pytest.raises(InvalidVersion):
+        parse_version("invalid")